@@ -1,6 +1,6 @@
 from abc import abstractmethod
 from weakref import WeakValueDictionary
-from typing import Iterable, Tuple, Type, Generic, TypeVar
+from typing import Callable, Iterable, Tuple, Type, Generic, TypeVar
 
 
 T = TypeVar('T')
@@ -75,6 +75,10 @@ class ResourceLevels(Generic[T]):
     """
     __slots__ = ()
     __fields__: Tuple[str] = ()
+    #: zero-valued instance of this specialisation, shared by all its
+    #: resources as a comparison bound; since instance values may be
+    #: changed, this instance must never be exposed to users
+    __zero__: 'ResourceLevels' = None
     #: cache of currently used specialisations to avoid
     #: recreating/duplicating commonly used types
     __specialisation_cache__ = WeakValueDictionary()
@@ -134,37 +138,60 @@ class ResourceLevels(Generic[T]):
         return f'{self.__class__.__name__}({content})'
 
 
-def __specialise__(zero: T, names: Iterable[str]) -> Type[ResourceLevels[T]]:
+def __specialise__(
+        zero_factory: Callable[[], T], names: Iterable[str]
+) -> Type[ResourceLevels[T]]:
     """
     Create a specialisation of :py:class:`~.ResourceLevels`
 
-    :param zero: zero value for all fields
+    :param zero_factory: callable providing the zero value for all fields
     :param names: names of fields
+
+    The ``zero_factory`` is only invoked when no specialisation for ``names``
+    is cached yet; the zero value of an existing specialisation is fixed.
     """
     fields = tuple(sorted(names))
     try:
         return ResourceLevels.__specialisation_cache__[fields]
     except KeyError:
         pass
+    zero = zero_factory()
 
     class SpecialisedResourceLevels(ResourceLevels):
         __slots__ = fields
         __fields__ = fields
 
         __init__ = __make_init__(zero, fields)
+        __from_values__ = __make_from_values__(fields)
+        __values__ = __make_values__(fields)
+
+        def __iter__(self):
+            return zip(self.__fields__, self.__values__())
 
         __add__ = __binary_op__('__add__', '+', fields)
         __sub__ = __binary_op__('__sub__', '-', fields)
 
+        __bounded__ = __make_bounded__(fields)
+
         __gt__ = __comparison_op__('__gt__', '>', fields)
         __ge__ = __comparison_op__('__ge__', '>=', fields)
         __le__ = __comparison_op__('__le__', '<=', fields)
-        __lt__ = __comparison_op__('__le__', '<', fields)
-        __eq__ = __comparison_op__('__eq__', '==', fields)
+        __lt__ = __comparison_op__('__lt__', '<', fields)
+
+        # equality is elementwise on the value tuples, which tuples compare
+        # at C level; the ordering operators must remain per-field chains
+        # since tuple ordering is lexicographic, not elementwise
+        def __eq__(self, other):
+            assert type(self) is type(other),\
+                'resource levels specialisations cannot be mixed'
+            return self.__values__() == other.__values__()
 
         def __ne__(self, other):
-            return not self == other
+            assert type(self) is type(other),\
+                'resource levels specialisations cannot be mixed'
+            return self.__values__() != other.__values__()
 
+    SpecialisedResourceLevels.__zero__ = SpecialisedResourceLevels()
     ResourceLevels.__specialisation_cache__[fields] = SpecialisedResourceLevels
     return SpecialisedResourceLevels
 
@@ -187,6 +214,69 @@ def __make_init__(zero, names: Tuple[str, ...]):
     return namespace['__init__']
 
 
+def __make_values__(names: Tuple[str, ...]):
+    """
+    Make a ``__values__`` method returning values ordered to match ``names``
+
+    .. code:: python3
+
+        __values__ = __make_values__(('foo', 'bar'))
+
+        def __values__(self):
+            return self.foo, self.bar
+
+    This extracts all field values in one expression, without looking up
+    field names or calling :py:func:`getattr` per field.
+    """
+    namespace = {}
+    exec(
+        '\n'.join(
+            [
+                """def __values__(self):""",
+                f"""    return {', '.join(f'self.{name}' for name in names)},"""
+            ]
+        ),
+        namespace
+    )
+    return namespace['__values__']
+
+
+def __make_from_values__(names: Tuple[str, ...]):
+    """
+    Make a ``__from_values__`` classmethod taking ``names`` as positional values
+
+    .. code:: python3
+
+        __from_values__ = __make_from_values__(('foo', 'bar'))
+
+        @classmethod
+        def __from_values__(cls, foo, bar):
+            self = cls.__new__(cls)
+            self.foo = foo
+            self.bar = bar
+            return self
+
+    Unlike ``__init__``, this bypasses keyword matching and default handling;
+    it is the fast path for operators which compute values for all fields anyway.
+    """
+    namespace = {}
+    exec(
+        '\n'.join(
+            [
+                f"""def __from_values__(cls, {', '.join(names)}):""",
+                """    self = cls.__new__(cls)""",
+            ] + [
+                f"""    self.{name} = {name}"""
+                for name in names
+            ] + [
+                """    return self"""
+            ]
+        ),
+        namespace
+    )
+    return classmethod(namespace['__from_values__'])
+
+
 def __binary_op__(op_name: str, op_symbol: str, names: Tuple[str, ...]):
     """
     Make an operator method ``op_name`` to apply ``op_symbol`` to all fields ``names``
@@ -196,9 +286,9 @@ def __binary_op__(op_name: str, op_symbol: str, names: Tuple[str, ...]):
         __add__ = __make_binary_op__("__add__", '+', ('foo', 'bar'))
 
         def __add__(self, other):
-            return type(self)(
-                foo = self.foo + other.foo,
-                bar = self.bar + other.bar,
+            return type(self).__from_values__(
+                self.foo + other.foo,
+                self.bar + other.bar,
             )
     """
     namespace = {}
@@ -208,9 +298,9 @@ def __binary_op__(op_name: str, op_symbol: str, names: Tuple[str, ...]):
                 f"""def {op_name}(self, other):""",
                 """    assert type(self) is type(other),\\""",
                 """        'resource levels specialisations cannot be mixed'""",
-                """    return type(self)(""",
+                """    return type(self).__from_values__(""",
             ] + [
-                f"""        {name} = self.{name} {op_symbol} other.{name},"""
+                f"""        self.{name} {op_symbol} other.{name},"""
                 for name in names
             ] + [
                 """           )"""
@@ -221,19 +311,58 @@ def __binary_op__(op_name: str, op_symbol: str, names: Tuple[str, ...]):
     return namespace[op_name]
 
 
+def __make_bounded__(names: Tuple[str, ...]):
+    """
+    Make a ``__bounded__`` method checking all fields ``names`` against two bounds
+
+    .. code:: python3
+
+        __bounded__ = __make_bounded__(('foo', 'bar'))
+
+        def __bounded__(self, lower, upper):
+            return (
+                lower.foo <= self.foo <= upper.foo
+                and lower.bar <= self.bar <= upper.bar
+            )
+
+    Chaining both bounds per field fuses what would otherwise be two full
+    comparisons into a single short-circuiting pass.
+    """
+    namespace = {}
+    exec(
+        '\n'.join(
+            [
+                """def __bounded__(self, lower, upper):""",
+                """    return (""",
+                f"""        lower.{names[0]} <= self.{names[0]}"""
+                f""" <= upper.{names[0]}"""
+            ] + [
+                f"""        and lower.{name} <= self.{name} <= upper.{name}"""
+                for name in names[1:]
+            ] + [
+                """           )"""
+            ]
+        ),
+        namespace
+    )
+    return namespace['__bounded__']
+
+
 def __comparison_op__(op_name: str, op_symbol: str, names: Tuple[str]):
     """
     Make a comparison method ``op_name`` to apply ``op_symbol`` to all fields ``names``
 
     .. code:: python3
 
-        __eq__ = __make_binary_op__("__eq__", '==', ('foo', 'bar'))
+        __ge__ = __make_binary_op__("__ge__", '>=', ('foo', 'bar'))
 
-        def __add__(self, other):
+        def __ge__(self, other):
             return (
-                self.foo + other.foo
-                and self.bar + other.bar
+                self.foo >= other.foo
+                and self.bar >= other.bar
             )
+
+    The per-field comparisons short-circuit on the first field that fails.
     """
     namespace = {}
     exec(
@@ -7,6 +7,9 @@ from .tracked import Tracked
 
 T = TypeVar('T')
 
+#: maximum number of debit levels interned per resource supply
+DEBIT_CACHE_SIZE = 128
+
 
 class ResourcesUnavailable(Exception):
     """Resources requested from a supply are not available"""
@@ -20,10 +23,13 @@ class BaseResources(Generic[T]):
     """
     Internal base class for resource types
     """
+    __slots__ = '_levels_type', '_available', '_zero', '_debit_cache'
     _levels_type: Type[ResourceLevels[T]]
     _available: Tracked[ResourceLevels[T]]
     #: ResourceLevels representing no available resources
     _zero: ResourceLevels[T]
+    #: previously derived debit levels, interned by borrow amounts
+    _debit_cache: Dict[tuple, ResourceLevels[T]]
 
     @property
     def levels(self) -> ResourceLevels[T]:
@@ -43,6 +49,21 @@ class BaseResources(Generic[T]):
         new_levels = self._available.value - amounts
         await self._available.set(new_levels)
 
+    def __debit_levels__(self, amounts: Dict[str, T]) -> ResourceLevels[T]:
+        """Resource levels matching ``amounts``, interned for recurring borrows"""
+        key = tuple(amounts.items())
+        try:
+            return self._debit_cache[key]
+        except KeyError:
+            # bound the cache so continuously varying amounts cannot leak
+            if len(self._debit_cache) >= DEBIT_CACHE_SIZE:
+                del self._debit_cache[next(iter(self._debit_cache))]
+            levels = self._debit_cache[key] = self._levels_type(**amounts)
+            return levels
+        except TypeError:
+            # unhashable amounts cannot be interned
+            return self._levels_type(**amounts)
+
     def borrow(self, **amounts: T) -> 'BorrowedResources[T]':
         """
         Temporarily borrow resources for a given context
@@ -50,7 +71,7 @@ class BaseResources(Generic[T]):
         :param amounts: resource levels to borrow
         :return: async context to borrow resources
         """
-        borrowed_levels = self._levels_type(**amounts)
+        borrowed_levels = self.__debit_levels__(amounts)
         assert self._zero <= borrowed_levels,\
             'cannot borrow negative amounts'
         return BorrowedResources(self, borrowed_levels)
@@ -107,58 +128,70 @@ class BorrowedResources(BaseResources[T]):
     """
     Fixed supply of named resources temporarily taken from another resource supply
     """
-    @property
-    def _levels_type(self):
-        return self._resources._levels_type
+    __slots__ = '_resources', '_debits', '_supply_condition'
 
     @property
     def limits(self):
         """Upper limit of resource levels"""
-        return self._debits
+        # debits may be interned across borrows - hand out a private copy
+        return self._levels_type.__from_values__(*self._debits.__values__())
 
     def __init__(self, resources: 'BaseResources', debits: ResourceLevels):
         self._resources = resources
-        self._zero = self._levels_type()
+        self._levels_type = resources._levels_type
+        self._zero = self._levels_type.__zero__
         self._debits = debits
+        self._debit_cache = {}
+        self._supply_condition = None
+        # levels are public and may be mutated - never hand out the shared zero
         self._available = Tracked(self._levels_type())
 
+    def __supply_condition__(self):
+        """Condition that the parent supply can cover our debits"""
+        condition = self._supply_condition
+        if condition is None:
+            condition = self._supply_condition =\
+                self._resources._available >= self._debits
+        return condition
+
     async def __aenter__(self):
+        supply_sufficient = self.__supply_condition__()
         # do not postpone if we can resume immediately
-        if not self._resources._available >= self._debits:
-            await (self._resources._available >= self._debits)
+        if not supply_sufficient:
+            await supply_sufficient
         await self._resources.__remove_resources__(self._debits)
         await self.__insert_resources__(self._debits)
         return self
 
+    async def __release_resources__(self):
+        await self.__remove_resources__(self._debits)
+        await self._resources.__insert_resources__(self._debits)
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         if exc_type is GeneratorExit:
             # we are killed forcefully and cannot perform async operations
             # dispatch a new activity to release our resources eventually
-            __LOOP_STATE__.LOOP.schedule(
-                self.__remove_resources__(self._debits)
-            )
-            __LOOP_STATE__.LOOP.schedule(
-                self._resources.__insert_resources__(self._debits)
-            )
+            __LOOP_STATE__.LOOP.schedule(self.__release_resources__())
         else:
-            await self.__remove_resources__(self._debits)
-            await self._resources.__insert_resources__(self._debits)
+            await self.__release_resources__()
             # TODO: forcefully kill off anyone holding our resources?
 
     def borrow(self, **amounts: T) -> 'BorrowedResources[T]':
-        borrowing = super().borrow(**amounts)
-        assert self._debits >= borrowing._debits,\
-            'cannot borrow beyond capacity'
-        return borrowing
+        borrowed_levels = self.__debit_levels__(amounts)
+        assert borrowed_levels.__bounded__(self._zero, self._debits),\
+            'cannot borrow negative amounts or beyond capacity'
+        return BorrowedResources(self, borrowed_levels)
 
 
 class ClaimedResources(BorrowedResources[T]):
     """
     Fixed supply of resources temporarily taken without delay
     """
+    __slots__ = ()
+
     async def __aenter__(self):
         # do not postpone if we can resume immediately
-        if not self._resources._available >= self._debits:
+        if not self.__supply_condition__():
             raise ResourcesUnavailable(self)
         return await super().__aenter__()
 
@@ -185,6 +218,8 @@ class Capacities(BorrowedResources[T]):
     cannot be leaked. Once resources are :py:meth:`~.borrow`\ ed, they can
     always be returned promptly.
     """
+    __slots__ = ()
+
     def __init__(self, __zero__: Optional[T] = None, **capacity: T):
         resources = Resources(__zero__, **capacity)
         super().__init__(resources, resources.levels)
@@ -220,15 +255,23 @@ class Resources(BaseResources[T]):
     Once resources are :py:meth:`~.borrow`\ ed, they can
     always be returned promptly.
     """
+    __slots__ = ()
+
     def __init__(self, __zero__: Optional[T] = None, **capacity: T):
         if not capacity:  # Note: this should be a type-error not assert for consistency
             raise TypeError(
                 '%s requires at least 1 keyword-only argument' % self.__class__.__name__
             )
-        __zero__ = __zero__ if __zero__ is not None else\
-            type(next(iter(capacity.values())))()  # bare type invocation must be zero
-        self._levels_type = __specialise__(__zero__, capacity.keys())
-        self._zero = self._levels_type()
+        if __zero__ is not None:
+            def zero_factory():
+                return __zero__
+        else:
+            # bare type invocation must be zero
+            def zero_factory():
+                return type(next(iter(capacity.values())))()
+        self._levels_type = __specialise__(zero_factory, capacity.keys())
+        self._zero = self._levels_type.__zero__
+        self._debit_cache = {}
         self._available = Tracked(self._levels_type(**capacity))
         assert self._available >= self._zero,\
             'initial capacities must be greater than or equal to zero'
@@ -244,11 +287,12 @@ class Resources(BaseResources[T]):
         below zero. If a resource is not specified, its level remains
         unchanged.
         """
-        assert self._zero <= self._levels_type(**amounts),\
-            'cannot increase by negative amounts'
-        new_levels = dict(self._available.value).copy()
+        new_levels = dict(self._available.value)
         new_levels.update(amounts)
-        await self._available.set(self._levels_type(**new_levels))
+        new_value = self._levels_type(**new_levels)
+        assert self._zero <= new_value,\
+            'cannot set negative amounts'
+        await self._available.set(new_value)
 
     async def increase(self, **amounts: T):
         """
@@ -22,6 +22,8 @@ class AsyncComparison(Condition):
     supported. Like any :py:class:`~.Condition`, it can be used both
     in an asynchronous and boolean context.
     """
+    __slots__ = ('_condition', '_left', '_right', '_test', '__weakref__')
+
     _operator_symbol = {
         operator.lt: '<',
         operator.le: '<=',
@@ -131,10 +133,20 @@ class Tracked(Generic[V]):
         self._listeners.add(listener)
 
     async def set(self, to: V):
-        """Set the value"""
-        self._value = to
-        for listener in list(self._listeners):
-            listener.__on_changed__()
+        """
+        Set the value
+
+        Listeners are only notified if ``to`` is a different object than
+        the current value. In particular, changing a mutable value in
+        place and re-``set``\\ ting it does not trigger events; replace
+        mutable values, e.g. by a modified copy, for their changes to be
+        detected.
+        """
+        if to is not self._value:
+            self._value = to
+            if self._listeners:
+                for listener in list(self._listeners):
+                    listener.__on_changed__()
         await postpone()
 
     # boolean operations producing an AsyncComparison
@@ -5,7 +5,7 @@ from typing import Type
 from usim import Scope, time, until
 from usim import Resources, Capacities, ResourcesUnavailable
 from usim.typing import ResourceLevels
-from usim._basics.resource import BaseResources
+from usim._basics.resource import BaseResources, DEBIT_CACHE_SIZE
 
 from ..utility import via_usim, assertion_mode
 
@@ -71,6 +71,34 @@ class BaseResourceCase:
         async with resources.borrow(a=10, b=10):
             assert True
 
+    @via_usim
+    async def test_borrow_levels_mutable(self):
+        """Mutating the levels of one borrow must not corrupt other supplies"""
+        resources = self.resource_type(a=10, b=10)
+        resources.borrow(a=1).levels.a = 999
+        fresh = self.resource_type(a=5, b=5)
+        assert fresh.levels == fresh.resource_type(a=5, b=5)
+        async with resources.borrow(a=10, b=10):
+            assert True
+
+    @via_usim
+    async def test_borrow_unhashable(self):
+        """Amounts with unhashable values cannot be interned but still work"""
+        # dedicated field names to get a specialisation with a list zero
+        resources = self.resource_type(list_a=[1], list_b=[2])
+        first = resources.borrow(list_a=[1])
+        second = resources.borrow(list_a=[1])
+        assert first.limits == second.limits
+        assert not resources._debit_cache
+
+    @via_usim
+    async def test_borrow_intern_bounded(self):
+        """The intern cache must not grow without bound"""
+        resources = self.resource_type(a=10000, b=10000)
+        for count in range(2 * DEBIT_CACHE_SIZE):
+            resources.borrow(a=count)
+        assert len(resources._debit_cache) <= DEBIT_CACHE_SIZE
+
     @via_usim
     async def test_claim(self):
         resources = self.resource_type(a=10, b=10)
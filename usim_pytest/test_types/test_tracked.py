@@ -42,6 +42,29 @@ class TestTracked:
         with pytest.raises(TypeError):
             bool(tracked)
 
+    @via_usim
+    async def test_set_identical(self):
+        """Setting the identical object must not notify, a new object must"""
+        tracked = Tracked([1137])
+        woken = []
+
+        async def wait_for_change():
+            await (tracked == [1137, 42])
+            woken.append(time.now)
+
+        async with Scope() as scope:
+            scope.do(wait_for_change())
+            await (time + 10)
+            tracked.value.append(42)
+            # re-setting the same object is a no-op and wakes no listeners
+            await tracked.set(tracked.value)
+            await (time + 10)
+            assert not woken
+            # setting a fresh object notifies waiters as usual
+            await tracked.set(list(tracked.value))
+            await (time + 10)
+            assert woken == [20]
+
     @via_usim
     async def test_operators(self):
         for op in modifying_operators: